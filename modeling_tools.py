@@ -9,17 +9,241 @@ Note: In the final application, these functions will communicate with live 3D so
 through the Nexus Engine. For now, this structure serves as the template and testing framework.
 """
 
-from typing import Dict, List, Tuple, Union, Optional
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from itertools import chain
+import sys
 import time
 
+from skill_common import FloatArray, IntArray, Record, SkillResult, error, success, vec3
+
+_perf = time.perf_counter
+
+
+# Option sets are built once at import; the tuples keep the documented order
+# for error messages while the frozensets give O(1) membership checks.
+_PRIMITIVE_OPTIONS = ('cube', 'sphere', 'cylinder', 'cone', 'plane', 'torus')
+_VALID_PRIMITIVES = frozenset(_PRIMITIVE_OPTIONS)
+_AXIS_OPTIONS = ('X', 'Y', 'Z')
+
+# Axes are validated on the character ordinal: OR-ing 0x20 folds 'X'/'Y'/'Z'
+# onto 'x'/'y'/'z' (0x78-0x7a), so no case-converted string is allocated.
+_AXIS_ORDS = (0x78, 0x79, 0x7a)
+_AXIS_NAMES = {0x78: 'X', 0x79: 'Y', 0x7a: 'Z'}
+
+# Per-primitive strings are built and interned once so create_primitive never
+# formats them on the success path
+_CAP_NAME = {pt: sys.intern(pt.capitalize()) for pt in _PRIMITIVE_OPTIONS}
+_DEFAULT_NAME = {pt: sys.intern(f'{cap}.001') for pt, cap in _CAP_NAME.items()}
+_MSG_CREATED = {pt: sys.intern(f'{cap} primitive created successfully') for pt, cap in _CAP_NAME.items()}
+
+# Simulated (vertex_count, face_count) for each primitive
+_GEOMETRY = {
+    'cube': (8, 6),
+    'sphere': (482, 480),
+    'cylinder': (64, 62),
+    'cone': (33, 31),
+    'plane': (4, 1),
+    'torus': (576, 576)
+}
+
+# Per-type columns used by create_primitives_batch
+_VERTEX_COUNTS = {pt: geometry[0] for pt, geometry in _GEOMETRY.items()}
+_FACE_COUNTS = {pt: geometry[1] for pt, geometry in _GEOMETRY.items()}
+
+# Vertex multiplier (4**level) and performance impact for each valid subdivision level
+_SUBDIV_MULT = (1, 4, 16, 64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+_PERF_IMPACT = ('low', 'low', 'medium', 'medium', 'high', 'high', 'high', 'high', 'high', 'high', 'high')
+
+_ERR_SIZE = 'Size must be greater than 0'
+_ERR_NO_FACES = 'No faces selected for extrusion'
+_ERR_SUBDIVISION_LEVEL = 'Subdivision level must be between 1 and 10'
+_ERR_ARRAY_COUNT = 'Array count must be at least 1'
+_ERR_BATCH_LENGTH = 'Subdivision levels and base vertex counts must have the same length'
+_ERR_VERTEX_COUNT = 'Base vertex counts must be whole numbers of 0 or greater'
+_ERR_PRIMITIVE_BATCH_LENGTH = 'Primitive types, sizes, locations and rotations must have the same length'
+_ERR_TRANSFORM = 'Location and rotation must have exactly 3 components'
+_ERR_DIRECTION = 'Direction must have exactly 3 components'
+
+
+class PrimitiveData(Record):
+    """Payload returned by create_primitive."""
+    _fields: tuple[str, ...] = (
+        'object_name', 'primitive_type', 'location', 'rotation', 'size', 'vertex_count',
+        'face_count'
+    )
+    __slots__ = _fields
+
+    def __init__(
+        self,
+        object_name: str,
+        primitive_type: str,
+        location: FloatArray,
+        rotation: FloatArray,
+        size: float,
+        vertex_count: int,
+        face_count: int
+    ) -> None:
+        self.object_name = object_name
+        self.primitive_type = primitive_type
+        self.location = location
+        self.rotation = rotation
+        self.size = size
+        self.vertex_count = vertex_count
+        self.face_count = face_count
+
+
+class PrimitiveBatchData(Record):
+    """
+    Payload returned by create_primitives_batch.
+
+    Stored column-wise: entry i of every field describes the i-th object. Sizes are
+    packed into a float64 array, vertex/face counts into contiguous int32 arrays,
+    and locations/rotations into float32 arrays of flattened (X, Y, Z) triples.
+    """
+    _fields: tuple[str, ...] = (
+        'object_names', 'primitive_types', 'sizes', 'locations', 'rotations',
+        'vertex_counts', 'face_counts', 'total_vertex_count'
+    )
+    __slots__ = _fields
+
+    def __init__(
+        self,
+        object_names: list[str],
+        primitive_types: list[str],
+        sizes: FloatArray,
+        locations: FloatArray,
+        rotations: FloatArray,
+        vertex_counts: IntArray,
+        face_counts: IntArray,
+        total_vertex_count: int
+    ) -> None:
+        self.object_names = object_names
+        self.primitive_types = primitive_types
+        self.sizes = sizes
+        self.locations = locations
+        self.rotations = rotations
+        self.vertex_counts = vertex_counts
+        self.face_counts = face_counts
+        self.total_vertex_count = total_vertex_count
+
+
+class ExtrusionData(Record):
+    """Payload returned by extrude_faces."""
+    _fields: tuple[str, ...] = ('object_name', 'extruded_faces', 'extrude_distance', 'direction')
+    __slots__ = _fields
+
+    def __init__(
+        self,
+        object_name: str,
+        extruded_faces: int,
+        extrude_distance: float,
+        direction: FloatArray
+    ) -> None:
+        self.object_name = object_name
+        self.extruded_faces = extruded_faces
+        self.extrude_distance = extrude_distance
+        self.direction = direction
+
+
+class SubdivisionData(Record):
+    """Payload returned by subdivide_surface."""
+    _fields: tuple[str, ...] = (
+        'object_name', 'subdivision_level', 'smooth_shading', 'new_vertex_count',
+        'performance_impact'
+    )
+    __slots__ = _fields
+
+    def __init__(
+        self,
+        object_name: str,
+        subdivision_level: int,
+        smooth_shading: bool,
+        new_vertex_count: int,
+        performance_impact: str
+    ) -> None:
+        self.object_name = object_name
+        self.subdivision_level = subdivision_level
+        self.smooth_shading = smooth_shading
+        self.new_vertex_count = new_vertex_count
+        self.performance_impact = performance_impact
+
+
+class SubdivisionBatchData(Record):
+    """Payload returned by subdivide_surface_batch."""
+    _fields: tuple[str, ...] = (
+        'object_count', 'subdivision_levels', 'new_vertex_counts', 'total_vertex_count'
+    )
+    __slots__ = _fields
+
+    def __init__(
+        self,
+        object_count: int,
+        subdivision_levels: IntArray,
+        new_vertex_counts: list[int],
+        total_vertex_count: int
+    ) -> None:
+        self.object_count = object_count
+        self.subdivision_levels = subdivision_levels
+        self.new_vertex_counts = new_vertex_counts
+        self.total_vertex_count = total_vertex_count
+
+
+class MirrorData(Record):
+    """Payload returned by apply_mirror_modifier."""
+    _fields: tuple[str, ...] = (
+        'object_name', 'mirror_axis', 'use_clipping', 'merge_threshold',
+        'estimated_vertex_doubling'
+    )
+    __slots__ = _fields
+
+    def __init__(
+        self,
+        object_name: str,
+        mirror_axis: str,
+        use_clipping: bool,
+        merge_threshold: float,
+        estimated_vertex_doubling: bool = True
+    ) -> None:
+        self.object_name = object_name
+        self.mirror_axis = mirror_axis
+        self.use_clipping = use_clipping
+        self.merge_threshold = merge_threshold
+        self.estimated_vertex_doubling = estimated_vertex_doubling
+
+
+class ArrayData(Record):
+    """Payload returned by create_array_modifier."""
+    _fields: tuple[str, ...] = (
+        'object_name', 'total_instances', 'offset_distance', 'array_axis',
+        'total_length'
+    )
+    __slots__ = _fields
+
+    def __init__(
+        self,
+        object_name: str,
+        total_instances: int,
+        offset_distance: float,
+        array_axis: str,
+        total_length: float
+    ) -> None:
+        self.object_name = object_name
+        self.total_instances = total_instances
+        self.offset_distance = offset_distance
+        self.array_axis = array_axis
+        self.total_length = total_length
+
 
 def create_primitive(
     primitive_type: str = 'cube',
     size: float = 2.0,
-    location: Tuple[float, float, float] = (0.0, 0.0, 0.0),
-    rotation: Tuple[float, float, float] = (0.0, 0.0, 0.0),
-    name: Optional[str] = None
-) -> Dict[str, Union[str, Dict, float]]:
+    location: Sequence[float] = (0.0, 0.0, 0.0),
+    rotation: Sequence[float] = (0.0, 0.0, 0.0),
+    name: str | None = None
+) -> SkillResult:
     """
     Creates a new primitive mesh object in the 3D scene.
 
@@ -27,27 +251,28 @@ def create_primitive(
         primitive_type (str): The type of primitive to create. 
                              Options: 'cube', 'sphere', 'cylinder', 'cone', 'plane', 'torus'
         size (float): The base size/scale of the primitive (default: 2.0)
-        location (Tuple[float, float, float]): World coordinates (X, Y, Z) for placement
-        rotation (Tuple[float, float, float]): Rotation in radians (X, Y, Z)
-        name (Optional[str]): Custom name for the object. If None, auto-generated.
+        location (Sequence[float]): World coordinates (X, Y, Z) for placement
+        rotation (Sequence[float]): Rotation in radians (X, Y, Z)
+        name (str | None): Custom name for the object. If None, auto-generated.
 
     Returns:
-        Dict: Standardized response containing:
+        SkillResult: Standardized result containing:
             - status: 'success', 'error', or 'warning'
             - message: Human-readable status message
-            - data: Object creation details including name, location, etc.
+            - data: PrimitiveData with the object name, location, etc.
             - execution_time: Time taken to execute the operation
 
     Example:
         >>> result = create_primitive('sphere', size=3.0, location=(5, 0, 2))
-        >>> print(result)
+        >>> print(result.to_dict())
         {
             'status': 'success',
             'message': 'Sphere primitive created successfully',
             'data': {
                 'object_name': 'Sphere.001',
                 'primitive_type': 'sphere',
-                'location': (5.0, 0.0, 2.0),
+                'location': [5.0, 0.0, 2.0],
+                'rotation': [0.0, 0.0, 0.0],
                 'size': 3.0,
                 'vertex_count': 482,
                 'face_count': 480
@@ -55,94 +280,156 @@ def create_primitive(
             'execution_time': 0.045
         }
     """
-    start_time = time.time()
+    start = _perf()
     
     # Validate inputs
-    valid_primitives = ['cube', 'sphere', 'cylinder', 'cone', 'plane', 'torus']
-    if primitive_type.lower() not in valid_primitives:
-        return {
-            'status': 'error',
-            'message': f'Invalid primitive type "{primitive_type}". Valid options: {valid_primitives}',
-            'data': {},
-            'execution_time': time.time() - start_time
-        }
+    pt = primitive_type if primitive_type in _VALID_PRIMITIVES else primitive_type.lower()
+    if pt not in _VALID_PRIMITIVES:
+        return error(f'Invalid primitive type "{primitive_type}". Valid options: {list(_PRIMITIVE_OPTIONS)}', start)
     
     if size <= 0:
-        return {
-            'status': 'error',
-            'message': 'Size must be greater than 0',
-            'data': {},
-            'execution_time': time.time() - start_time
-        }
+        return error(_ERR_SIZE, start)
+    
+    loc = vec3(location)
+    rot = vec3(rotation)
+    if loc is None or rot is None:
+        return error(_ERR_TRANSFORM, start)
     
     # Generate object name if not provided
     if name is None:
-        name = f"{primitive_type.capitalize()}.001"
+        name = _DEFAULT_NAME[pt]
     
     # In real implementation, this would execute Blender commands like:
     # bpy.ops.mesh.primitive_cube_add(size=size, location=location, rotation=rotation)
     # bpy.context.active_object.name = name
     
-    # Simulate vertex/face counts for different primitives
-    geometry_data = {
-        'cube': {'vertices': 8, 'faces': 6},
-        'sphere': {'vertices': 482, 'faces': 480},
-        'cylinder': {'vertices': 64, 'faces': 62},
-        'cone': {'vertices': 33, 'faces': 31},
-        'plane': {'vertices': 4, 'faces': 1},
-        'torus': {'vertices': 576, 'faces': 576}
-    }
-    
-    execution_time = time.time() - start_time
-    
-    return {
-        'status': 'success',
-        'message': f'{primitive_type.capitalize()} primitive created successfully',
-        'data': {
-            'object_name': name,
-            'primitive_type': primitive_type,
-            'location': location,
-            'rotation': rotation,
-            'size': size,
-            'vertex_count': geometry_data[primitive_type]['vertices'],
-            'face_count': geometry_data[primitive_type]['faces']
-        },
-        'execution_time': execution_time
-    }
+    vertex_count, face_count = _GEOMETRY[pt]
+    
+    return success(
+        _MSG_CREATED[pt],
+        PrimitiveData(
+            object_name=name,
+            primitive_type=pt,
+            location=loc,
+            rotation=rot,
+            size=size,
+            vertex_count=vertex_count,
+            face_count=face_count
+        ),
+        start
+    )
+
+
+def create_primitives_batch(
+    primitive_types: Sequence[str],
+    sizes: Sequence[float],
+    locations: Sequence[Sequence[float]],
+    rotations: Sequence[Sequence[float]] | None = None
+) -> SkillResult:
+    """
+    Creates many primitive mesh objects in a single call.
+
+    Validation, naming and geometry lookups are done once for the whole batch,
+    so populating a scene with N objects avoids N separate create_primitive calls.
+
+    Args:
+        primitive_types (Sequence[str]): Primitive type of each object (see create_primitive)
+        sizes (Sequence[float]): Base size/scale of each object
+        locations (Sequence[Sequence[float]]): World coordinates (X, Y, Z) of each object
+        rotations (Sequence[Sequence[float]] | None): Rotation (X, Y, Z) of each object in
+                                                      radians. If None, all zero.
+
+    Returns:
+        SkillResult: Standardized result with PrimitiveBatchData
+
+    Example:
+        >>> result = create_primitives_batch(['cube', 'cube', 'sphere'], [2.0, 2.0, 1.0],
+        ...                                  [(0, 0, 0), (3, 0, 0), (6, 0, 0)])
+        >>> print(result.data.object_names)
+        ['Cube.001', 'Cube.002', 'Sphere.001']
+    """
+    start = _perf()
+    
+    count = len(primitive_types)
+    if not count == len(sizes) == len(locations) or (rotations is not None and len(rotations) != count):
+        return error(_ERR_PRIMITIVE_BATCH_LENGTH, start)
+    
+    # Every vector is checked before flattening so ragged input cannot shift
+    # components onto a neighbouring object
+    if any(len(vector) != 3 for vector in locations) or (
+        rotations is not None and any(len(vector) != 3 for vector in rotations)
+    ):
+        return error(_ERR_TRANSFORM, start)
+    
+    # Flatten transforms into packed float32 (X, Y, Z) triples
+    locs = array('f', chain.from_iterable(locations))
+    rots = array('f', [0.0]) * (3 * count) if rotations is None else array('f', chain.from_iterable(rotations))
+    
+    types = [pt if pt in _VALID_PRIMITIVES else pt.lower() for pt in primitive_types]
+    for primitive_type, pt in zip(primitive_types, types):
+        if pt not in _VALID_PRIMITIVES:
+            return error(f'Invalid primitive type "{primitive_type}". Valid options: {list(_PRIMITIVE_OPTIONS)}', start)
+    
+    packed_sizes = array('d', sizes)
+    if count and min(packed_sizes) <= 0:
+        return error(_ERR_SIZE, start)
+    
+    # Number objects per type the way Blender does: Cube.001, Cube.002, ...
+    counters = dict.fromkeys(_PRIMITIVE_OPTIONS, 0)
+    object_names = []
+    for pt in types:
+        counters[pt] += 1
+        object_names.append(f'{_CAP_NAME[pt]}.{counters[pt]:03d}')
+    
+    vertex_counts = array('i', map(_VERTEX_COUNTS.__getitem__, types))
+    
+    return success(
+        f'{count} primitives created successfully',
+        PrimitiveBatchData(
+            object_names=object_names,
+            primitive_types=types,
+            sizes=packed_sizes,
+            locations=locs,
+            rotations=rots,
+            vertex_counts=vertex_counts,
+            face_counts=array('i', map(_FACE_COUNTS.__getitem__, types)),
+            total_vertex_count=sum(vertex_counts)
+        ),
+        start
+    )
 
 
 def extrude_faces(
     object_name: str,
-    face_indices: List[int],
+    face_indices: list[int],
     extrude_distance: float = 1.0,
-    direction: Tuple[float, float, float] = (0.0, 0.0, 1.0)
-) -> Dict[str, Union[str, Dict, float]]:
+    direction: Sequence[float] = (0.0, 0.0, 1.0)
+) -> SkillResult:
     """
     Extrudes selected faces of a mesh object.
 
     Args:
         object_name (str): Name of the target mesh object
-        face_indices (List[int]): List of face indices to extrude
+        face_indices (list[int]): List of face indices to extrude
         extrude_distance (float): Distance to extrude faces
-        direction (Tuple[float, float, float]): Direction vector for extrusion
+        direction (Sequence[float]): Direction vector (X, Y, Z) for extrusion
 
     Returns:
-        Dict: Standardized response with extrusion details
+        SkillResult: Standardized result with ExtrusionData
 
     Example:
         >>> result = extrude_faces('Cube.001', [0, 1, 2], 0.5)
-        >>> print(result['status'])
+        >>> print(result.status)
         'success'
     """
-    start_time = time.time()
+    start = _perf()
     
     if not face_indices:
-        return {
-            'status': 'error',
-            'message': 'No faces selected for extrusion',
-            'data': {},
-            'execution_time': time.time() - start_time
-        }
+        return error(_ERR_NO_FACES, start)
+    
+    direction_vector = vec3(direction)
+    if direction_vector is None:
+        return error(_ERR_DIRECTION, start)
     
     # In real implementation:
     # bpy.data.objects[object_name].select_set(True)
@@ -150,67 +437,121 @@ def extrude_faces(
     # bpy.ops.object.mode_set(mode='EDIT')
     # ... face selection and extrusion logic
     
-    return {
-        'status': 'success',
-        'message': f'Extruded {len(face_indices)} faces successfully',
-        'data': {
-            'object_name': object_name,
-            'extruded_faces': len(face_indices),
-            'extrude_distance': extrude_distance,
-            'direction': direction
-        },
-        'execution_time': time.time() - start_time
-    }
+    return success(
+        f'Extruded {len(face_indices)} faces successfully',
+        ExtrusionData(
+            object_name=object_name,
+            extruded_faces=len(face_indices),
+            extrude_distance=extrude_distance,
+            direction=direction_vector
+        ),
+        start
+    )
 
 
 def subdivide_surface(
     object_name: str,
-    subdivision_level: int = 1,
+    subdivision_level: float = 1,
     smooth: bool = True
-) -> Dict[str, Union[str, Dict, float]]:
+) -> SkillResult:
     """
     Applies subdivision surface modifier to increase mesh resolution.
 
     Args:
         object_name (str): Name of the target mesh object
-        subdivision_level (int): Number of subdivision levels (1-6 recommended)
+        subdivision_level (float): Number of subdivision levels (1-6 recommended); must be
+                                   a whole number, integral floats such as 2.0 are accepted
         smooth (bool): Whether to apply smooth shading
 
     Returns:
-        Dict: Standardized response with subdivision details
+        SkillResult: Standardized result with SubdivisionData
 
     Example:
         >>> result = subdivide_surface('Cube.001', subdivision_level=2)
-        >>> print(result['data']['new_vertex_count'])
+        >>> print(result.data.new_vertex_count)
         1538
     """
-    start_time = time.time()
-    
-    if subdivision_level < 1 or subdivision_level > 10:
-        return {
-            'status': 'error',
-            'message': 'Subdivision level must be between 1 and 10',
-            'data': {},
-            'execution_time': time.time() - start_time
-        }
+    start = _perf()
+    
+    # The range check runs first so NaN/inf never reach int()
+    if not 1 <= subdivision_level <= 10 or subdivision_level != int(subdivision_level):
+        return error(_ERR_SUBDIVISION_LEVEL, start)
+    level = int(subdivision_level)
     
     # Calculate approximate vertex count after subdivision
     # This is a simplified calculation for demonstration
     base_vertices = 8  # Assuming cube starting point
-    new_vertex_count = base_vertices * (4 ** subdivision_level)
-    
-    return {
-        'status': 'success',
-        'message': f'Subdivision surface applied at level {subdivision_level}',
-        'data': {
-            'object_name': object_name,
-            'subdivision_level': subdivision_level,
-            'smooth_shading': smooth,
-            'new_vertex_count': new_vertex_count,
-            'performance_impact': 'high' if subdivision_level > 3 else 'medium' if subdivision_level > 1 else 'low'
-        },
-        'execution_time': time.time() - start_time
-    }
+    new_vertex_count = base_vertices * _SUBDIV_MULT[level]
+    
+    return success(
+        f'Subdivision surface applied at level {level}',
+        SubdivisionData(
+            object_name=object_name,
+            subdivision_level=level,
+            smooth_shading=smooth,
+            new_vertex_count=new_vertex_count,
+            performance_impact=_PERF_IMPACT[level]
+        ),
+        start
+    )
+
+
+def subdivide_surface_batch(
+    subdivision_levels: Sequence[float],
+    base_vertex_counts: Sequence[float]
+) -> SkillResult:
+    """
+    Projects vertex counts after subdivision for many objects in one call.
+
+    Useful for previewing levels of detail across a whole scene without paying
+    the per-call overhead of subdivide_surface for every mesh.
+
+    Args:
+        subdivision_levels (Sequence[float]): Whole-number subdivision level (1-10) for each
+                                              object; integral floats such as 2.0 are accepted
+        base_vertex_counts (Sequence[float]): Whole-number vertex count (0 or more) of each
+                                              object before subdivision; integral floats
+                                              are accepted
+
+    Returns:
+        SkillResult: Standardized result with SubdivisionBatchData
+
+    Example:
+        >>> result = subdivide_surface_batch([1, 2, 3], [8, 8, 482])
+        >>> print(result.data.new_vertex_counts)
+        [32, 128, 30848]
+    """
+    start = _perf()
+    
+    if len(subdivision_levels) != len(base_vertex_counts):
+        return error(_ERR_BATCH_LENGTH, start)
+    
+    levels = array('i', [
+        int(level) for level in subdivision_levels
+        if 1 <= level <= 10 and level == int(level)
+    ])
+    if len(levels) != len(subdivision_levels):
+        return error(_ERR_SUBDIVISION_LEVEL, start)
+    
+    # NaN fails the comparison and inf leaves a NaN remainder, so neither reaches int()
+    counts = [int(base) for base in base_vertex_counts if base >= 0 and base % 1 == 0]
+    if len(counts) != len(base_vertex_counts):
+        return error(_ERR_VERTEX_COUNT, start)
+    
+    new_vertex_counts = [
+        base * _SUBDIV_MULT[level] for level, base in zip(levels, counts)
+    ]
+    
+    return success(
+        f'Subdivision projected for {len(new_vertex_counts)} objects',
+        SubdivisionBatchData(
+            object_count=len(new_vertex_counts),
+            subdivision_levels=levels,
+            new_vertex_counts=new_vertex_counts,
+            total_vertex_count=sum(new_vertex_counts)
+        ),
+        start
+    )
 
 
 def apply_mirror_modifier(
@@ -218,7 +559,7 @@ def apply_mirror_modifier(
     axis: str = 'X',
     use_clipping: bool = True,
     merge_threshold: float = 0.001
-) -> Dict[str, Union[str, Dict, float]]:
+) -> SkillResult:
     """
     Applies mirror modifier for symmetrical modeling.
 
@@ -229,36 +570,31 @@ def apply_mirror_modifier(
         merge_threshold (float): Distance threshold for merging vertices
 
     Returns:
-        Dict: Standardized response with mirror modifier details
+        SkillResult: Standardized result with MirrorData
 
     Example:
         >>> result = apply_mirror_modifier('Character.001', axis='X')
-        >>> print(result['status'])
+        >>> print(result.status)
         'success'
     """
-    start_time = time.time()
-    
-    valid_axes = ['X', 'Y', 'Z']
-    if axis.upper() not in valid_axes:
-        return {
-            'status': 'error',
-            'message': f'Invalid axis "{axis}". Valid options: {valid_axes}',
-            'data': {},
-            'execution_time': time.time() - start_time
-        }
+    start = _perf()
+    
+    code = ord(axis) | 0x20 if len(axis) == 1 else 0
+    if code not in _AXIS_ORDS:
+        return error(f'Invalid axis "{axis}". Valid options: {list(_AXIS_OPTIONS)}', start)
+    
+    mirror_axis = _AXIS_NAMES[code]
     
-    return {
-        'status': 'success',
-        'message': f'Mirror modifier applied on {axis.upper()} axis',
-        'data': {
-            'object_name': object_name,
-            'mirror_axis': axis.upper(),
-            'use_clipping': use_clipping,
-            'merge_threshold': merge_threshold,
-            'estimated_vertex_doubling': True
-        },
-        'execution_time': time.time() - start_time
-    }
+    return success(
+        f'Mirror modifier applied on {mirror_axis} axis',
+        MirrorData(
+            object_name=object_name,
+            mirror_axis=mirror_axis,
+            use_clipping=use_clipping,
+            merge_threshold=merge_threshold
+        ),
+        start
+    )
 
 
 def create_array_modifier(
@@ -266,7 +602,7 @@ def create_array_modifier(
     count: int = 3,
     offset_distance: float = 2.0,
     axis: str = 'X'
-) -> Dict[str, Union[str, Dict, float]]:
+) -> SkillResult:
     """
     Creates an array modifier to duplicate objects along an axis.
 
@@ -277,41 +613,30 @@ def create_array_modifier(
         axis (str): Array axis ('X', 'Y', or 'Z')
 
     Returns:
-        Dict: Standardized response with array modifier details
+        SkillResult: Standardized result with ArrayData
 
     Example:
         >>> result = create_array_modifier('Pillar.001', count=5, offset_distance=3.0)
-        >>> print(result['data']['total_instances'])
+        >>> print(result.data.total_instances)
         5
     """
-    start_time = time.time()
+    start = _perf()
     
     if count < 1:
-        return {
-            'status': 'error',
-            'message': 'Array count must be at least 1',
-            'data': {},
-            'execution_time': time.time() - start_time
-        }
+        return error(_ERR_ARRAY_COUNT, start)
     
-    valid_axes = ['X', 'Y', 'Z']
-    if axis.upper() not in valid_axes:
-        return {
-            'status': 'error',
-            'message': f'Invalid axis "{axis}". Valid options: {valid_axes}',
-            'data': {},
-            'execution_time': time.time() - start_time
-        }
+    code = ord(axis) | 0x20 if len(axis) == 1 else 0
+    if code not in _AXIS_ORDS:
+        return error(f'Invalid axis "{axis}". Valid options: {list(_AXIS_OPTIONS)}', start)
     
-    return {
-        'status': 'success',
-        'message': f'Array modifier created with {count} instances',
-        'data': {
-            'object_name': object_name,
-            'total_instances': count,
-            'offset_distance': offset_distance,
-            'array_axis': axis.upper(),
-            'total_length': offset_distance * (count - 1)
-        },
-        'execution_time': time.time() - start_time
-    }
\ No newline at end of file
+    return success(
+        f'Array modifier created with {count} instances',
+        ArrayData(
+            object_name=object_name,
+            total_instances=count,
+            offset_distance=offset_distance,
+            array_axis=_AXIS_NAMES[code],
+            total_length=offset_distance * (count - 1)
+        ),
+        start
+    )
\ No newline at end of file
@@ -6,98 +6,223 @@ This module contains skills for creating, managing, and applying materials and s
 in 3D software. Supports both procedural and image-based material workflows.
 """
 
-from typing import Dict, List, Tuple, Union, Optional
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
 import time
 
+from skill_common import FloatArray, Record, SkillResult, error, success
+
+_perf = time.perf_counter
+
+
+_TEXTURE_OPTIONS = ('noise', 'voronoi', 'wave', 'magic', 'brick', 'checker')
+_VALID_TEXTURES = frozenset(_TEXTURE_OPTIONS)
+
+_RENDER_ENGINES = ('Cycles', 'Eevee', 'Arnold', 'V-Ray')
+
+# Surface classification indexed by [metallic > 0.7][glossy / satin / rough]
+_SURF_CLASS = (
+    ('Dielectric Glossy', 'Dielectric Satin', 'Dielectric Rough'),
+    ('Metallic Glossy', 'Metallic Satin', 'Metallic Rough'),
+)
+
+_ERR_COLOR_RANGE = 'Color values must be between 0.0 and 1.0'
+_ERR_COLOR_COMPONENTS = 'Colors must have exactly 3 components (RGB)'
+_ERR_METALLIC_RANGE = 'Metallic value must be between 0.0 and 1.0'
+_ERR_ROUGHNESS_RANGE = 'Roughness value must be between 0.0 and 1.0'
+_ERR_MATERIAL_SLOT = 'Material slot must be 0 or greater'
+
+
+class MaterialProperties(Record):
+    """Shader properties of a PBR material."""
+    _fields: tuple[str, ...] = (
+        'base_color', 'metallic', 'roughness', 'normal_strength', 'emission_color',
+        'emission_strength'
+    )
+    __slots__ = _fields
+
+    def __init__(
+        self,
+        base_color: FloatArray,
+        metallic: float,
+        roughness: float,
+        normal_strength: float,
+        emission_color: FloatArray,
+        emission_strength: float
+    ) -> None:
+        self.base_color = base_color
+        self.metallic = metallic
+        self.roughness = roughness
+        self.normal_strength = normal_strength
+        self.emission_color = emission_color
+        self.emission_strength = emission_strength
+
+
+class MaterialData(Record):
+    """Payload returned by create_pbr_material."""
+    _fields: tuple[str, ...] = (
+        'material_name', 'surface_classification', 'properties', 'material_type',
+        'render_engine_compatibility'
+    )
+    __slots__ = _fields
+
+    def __init__(
+        self,
+        material_name: str,
+        surface_classification: str,
+        properties: MaterialProperties,
+        material_type: str = 'PBR',
+        render_engine_compatibility: tuple[str, ...] = _RENDER_ENGINES
+    ) -> None:
+        self.material_name = material_name
+        self.surface_classification = surface_classification
+        self.properties = properties
+        self.material_type = material_type
+        self.render_engine_compatibility = render_engine_compatibility
+
+
+class MaterialAssignmentData(Record):
+    """Payload returned by apply_material_to_object."""
+    _fields: tuple[str, ...] = (
+        'object_name', 'material_name', 'material_slot', 'application_method'
+    )
+    __slots__ = _fields
+
+    def __init__(
+        self,
+        object_name: str,
+        material_name: str,
+        material_slot: int,
+        application_method: str = 'direct_assignment'
+    ) -> None:
+        self.object_name = object_name
+        self.material_name = material_name
+        self.material_slot = material_slot
+        self.application_method = application_method
+
+
+class TextureProperties(Record):
+    """Node settings of a procedural texture."""
+    _fields: tuple[str, ...] = ('scale', 'detail', 'distortion', 'color_ramp_stops')
+    __slots__ = _fields
+
+    def __init__(
+        self,
+        scale: float,
+        detail: float,
+        distortion: float,
+        color_ramp_stops: int
+    ) -> None:
+        self.scale = scale
+        self.detail = detail
+        self.distortion = distortion
+        self.color_ramp_stops = color_ramp_stops
+
+
+class TextureData(Record):
+    """Payload returned by create_procedural_texture."""
+    _fields: tuple[str, ...] = (
+        'texture_name', 'texture_type', 'properties', 'node_type', 'output_type'
+    )
+    __slots__ = _fields
+
+    def __init__(
+        self,
+        texture_name: str,
+        texture_type: str,
+        properties: TextureProperties,
+        node_type: str = 'procedural',
+        output_type: str = 'color_and_factor'
+    ) -> None:
+        self.texture_name = texture_name
+        self.texture_type = texture_type
+        self.properties = properties
+        self.node_type = node_type
+        self.output_type = output_type
+
+
+def _range_error(values: tuple[float, ...]) -> str:
+    """Returns the error message for the first out-of-range PBR value."""
+    index = next(i for i, value in enumerate(values) if not 0.0 <= value <= 1.0)
+    if index < len(values) - 2:
+        return _ERR_COLOR_RANGE
+    return _ERR_METALLIC_RANGE if index == len(values) - 2 else _ERR_ROUGHNESS_RANGE
+
 
 def create_pbr_material(
     material_name: str,
-    base_color: Tuple[float, float, float] = (0.8, 0.8, 0.8),
+    base_color: Sequence[float] = (0.8, 0.8, 0.8),
     metallic: float = 0.0,
     roughness: float = 0.5,
     normal_strength: float = 1.0,
-    emission_color: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+    emission_color: Sequence[float] = (0.0, 0.0, 0.0),
     emission_strength: float = 0.0
-) -> Dict[str, Union[str, Dict, float]]:
+) -> SkillResult:
     """
     Creates a physically-based rendering (PBR) material with standard properties.
 
     Args:
         material_name (str): Name for the new material
-        base_color (Tuple[float, float, float]): RGB values (0-1) for base color
+        base_color (Sequence[float]): RGB values (0-1) for base color
         metallic (float): Metallic value (0-1), 0=dielectric, 1=metallic
         roughness (float): Surface roughness (0-1), 0=mirror, 1=completely rough
         normal_strength (float): Normal map intensity (0-2)
-        emission_color (Tuple[float, float, float]): RGB emission color
+        emission_color (Sequence[float]): RGB emission color
         emission_strength (float): Emission intensity
 
     Returns:
-        Dict: Material creation result with properties
+        SkillResult: Material creation result with MaterialData
 
     Example:
         >>> result = create_pbr_material('Steel', metallic=0.9, roughness=0.3)
-        >>> print(result['data']['material_type'])
+        >>> print(result.data.material_type)
         'PBR'
     """
-    start_time = time.time()
+    start = _perf()
     
-    # Validate color values
-    for color in [base_color, emission_color]:
-        if not all(0.0 <= c <= 1.0 for c in color):
-            return {
-                'status': 'error',
-                'message': 'Color values must be between 0.0 and 1.0',
-                'data': {},
-                'execution_time': time.time() - start_time
-            }
+    if len(base_color) != 3 or len(emission_color) != 3:
+        return error(_ERR_COLOR_COMPONENTS, start)
     
-    # Validate numeric ranges
-    if not (0.0 <= metallic <= 1.0):
-        return {
-            'status': 'error',
-            'message': 'Metallic value must be between 0.0 and 1.0',
-            'data': {},
-            'execution_time': time.time() - start_time
-        }
+    # Validate color values and numeric ranges with a single bounds check on the
+    # caller's values, before float32 packing can round them into range;
+    # min()/max() skip over NaN, so it is caught through the sum instead
+    values = (*base_color, *emission_color, metallic, roughness)
+    total = sum(values)
+    if total != total or min(values) < 0.0 or max(values) > 1.0:
+        return error(_range_error(values), start)
     
-    if not (0.0 <= roughness <= 1.0):
-        return {
-            'status': 'error',
-            'message': 'Roughness value must be between 0.0 and 1.0',
-            'data': {},
-            'execution_time': time.time() - start_time
-        }
+    base = array('f', base_color)
+    emission = array('f', emission_color)
     
     # Determine material characteristics
-    material_type = 'Metallic' if metallic > 0.7 else 'Dielectric'
-    surface_type = 'Glossy' if roughness < 0.3 else 'Rough' if roughness > 0.7 else 'Satin'
+    surface_index = 0 if roughness < 0.3 else 2 if roughness > 0.7 else 1
+    surface_classification = _SURF_CLASS[metallic > 0.7][surface_index]
     
-    return {
-        'status': 'success',
-        'message': f'PBR material "{material_name}" created successfully',
-        'data': {
-            'material_name': material_name,
-            'material_type': 'PBR',
-            'surface_classification': f'{material_type} {surface_type}',
-            'properties': {
-                'base_color': base_color,
-                'metallic': metallic,
-                'roughness': roughness,
-                'normal_strength': normal_strength,
-                'emission_color': emission_color,
-                'emission_strength': emission_strength
-            },
-            'render_engine_compatibility': ['Cycles', 'Eevee', 'Arnold', 'V-Ray']
-        },
-        'execution_time': time.time() - start_time
-    }
+    return success(
+        f'PBR material "{material_name}" created successfully',
+        MaterialData(
+            material_name=material_name,
+            surface_classification=surface_classification,
+            properties=MaterialProperties(
+                base_color=base,
+                metallic=metallic,
+                roughness=roughness,
+                normal_strength=normal_strength,
+                emission_color=emission,
+                emission_strength=emission_strength
+            )
+        ),
+        start
+    )
 
 
 def apply_material_to_object(
     object_name: str,
     material_name: str,
     material_slot: int = 0
-) -> Dict[str, Union[str, Dict, float]]:
+) -> SkillResult:
     """
     Applies an existing material to a 3D object.
 
@@ -107,34 +232,27 @@ def apply_material_to_object(
         material_slot (int): Material slot index (0-based)
 
     Returns:
-        Dict: Material application result
+        SkillResult: Material application result with MaterialAssignmentData
 
     Example:
         >>> result = apply_material_to_object('Cube.001', 'Steel')
-        >>> print(result['status'])
+        >>> print(result.status)
         'success'
     """
-    start_time = time.time()
+    start = _perf()
     
     if material_slot < 0:
-        return {
-            'status': 'error',
-            'message': 'Material slot must be 0 or greater',
-            'data': {},
-            'execution_time': time.time() - start_time
-        }
+        return error(_ERR_MATERIAL_SLOT, start)
     
-    return {
-        'status': 'success',
-        'message': f'Material "{material_name}" applied to "{object_name}"',
-        'data': {
-            'object_name': object_name,
-            'material_name': material_name,
-            'material_slot': material_slot,
-            'application_method': 'direct_assignment'
-        },
-        'execution_time': time.time() - start_time
-    }
+    return success(
+        f'Material "{material_name}" applied to "{object_name}"',
+        MaterialAssignmentData(
+            object_name=object_name,
+            material_name=material_name,
+            material_slot=material_slot
+        ),
+        start
+    )
 
 
 def create_procedural_texture(
@@ -143,8 +261,8 @@ def create_procedural_texture(
     scale: float = 1.0,
     detail: float = 2.0,
     distortion: float = 0.0,
-    color_ramp: Optional[List[Tuple[float, Tuple[float, float, float]]]] = None
-) -> Dict[str, Union[str, Dict, float]]:
+    color_ramp: list[tuple[float, tuple[float, float, float]]] | None = None
+) -> SkillResult:
     """
     Creates a procedural texture node for material use.
 
@@ -154,44 +272,35 @@ def create_procedural_texture(
         scale (float): Texture scale/frequency
         detail (float): Level of detail/octaves
         distortion (float): Distortion amount
-        color_ramp (Optional[List]): Color ramp stops as (position, (r,g,b)) tuples
+        color_ramp (list | None): Color ramp stops as (position, (r,g,b)) tuples
 
     Returns:
-        Dict: Texture creation result
+        SkillResult: Texture creation result with TextureData
 
     Example:
         >>> ramp = [(0.0, (0.0, 0.0, 0.0)), (1.0, (1.0, 1.0, 1.0))]
         >>> result = create_procedural_texture('RustNoise', 'noise', scale=5.0, color_ramp=ramp)
     """
-    start_time = time.time()
+    start = _perf()
     
-    valid_types = ['noise', 'voronoi', 'wave', 'magic', 'brick', 'checker']
-    if texture_type.lower() not in valid_types:
-        return {
-            'status': 'error',
-            'message': f'Invalid texture type "{texture_type}". Valid options: {valid_types}',
-            'data': {},
-            'execution_time': time.time() - start_time
-        }
+    if texture_type not in _VALID_TEXTURES and texture_type.lower() not in _VALID_TEXTURES:
+        return error(f'Invalid texture type "{texture_type}". Valid options: {list(_TEXTURE_OPTIONS)}', start)
     
     # Set default color ramp if none provided
     if color_ramp is None:
         color_ramp = [(0.0, (0.0, 0.0, 0.0)), (1.0, (1.0, 1.0, 1.0))]
     
-    return {
-        'status': 'success',
-        'message': f'Procedural texture "{texture_name}" created',
-        'data': {
-            'texture_name': texture_name,
-            'texture_type': texture_type,
-            'properties': {
-                'scale': scale,
-                'detail': detail,
-                'distortion': distortion,
-                'color_ramp_stops': len(color_ramp)
-            },
-            'node_type': 'procedural',
-            'output_type': 'color_and_factor'
-        },
-        'execution_time': time.time() - start_time
-    }
\ No newline at end of file
+    return success(
+        f'Procedural texture "{texture_name}" created',
+        TextureData(
+            texture_name=texture_name,
+            texture_type=texture_type,
+            properties=TextureProperties(
+                scale=scale,
+                detail=detail,
+                distortion=distortion,
+                color_ramp_stops=len(color_ramp)
+            )
+        ),
+        start
+    )
\ No newline at end of file
@@ -0,0 +1,175 @@
+"""
+Miktos Skill Library: Common Helpers
+====================================
+
+This module contains the result type and helpers shared by every skill module.
+All skills return a SkillResult carrying the standardized fields expected by the
+Miktos Agent: 'status', 'message', 'data' and 'execution_time'.
+
+Results and their data payloads are plain slotted classes (see Record) rather than
+nested dicts; SkillResult.to_dict() produces the plain dict format at the
+serialization boundary. They are deliberately not dataclasses: importing
+dataclasses (and the inspect module it pulls in) and building the classes would
+cost more at cold import than the rest of the skill library.
+
+Execution time is measured with the monotonic time.perf_counter() clock, and
+vectors and colors are stored as packed single-precision arrays (see vec3()).
+
+The modules are fully annotated so they can be compiled ahead of time with
+mypyc (see README); the plain Python sources remain importable as-is.
+
+Annotations are postponed (PEP 563) and only use names that exist at runtime, so
+importing the skill library never loads the typing module while
+typing.get_type_hints() can still resolve every signature and payload field.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+import time
+
+# Packed array types used in annotations. array only supports subscripting at
+# runtime from Python 3.12; older interpreters fall back to the bare class so
+# typing.get_type_hints() still resolves, while type checkers always see the
+# parameterized form.
+try:
+    FloatArray = array[float]
+    IntArray = array[int]
+except TypeError:
+    FloatArray = IntArray = array
+
+_perf = time.perf_counter
+
+
+def _plain(value: object) -> object:
+    """Converts a field value for to_dict(), so results stay JSON-friendly."""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, array):
+        return value.tolist()
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+class Record:
+    """
+    Base class of SkillResult and the skill payloads.
+
+    Subclasses list their attributes in _fields (which also serves as their
+    __slots__) and assign them in an explicit __init__; _fields drives repr(),
+    equality and to_dict().
+    """
+    _fields: tuple[str, ...] = ()
+    __slots__ = ()
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Converts the record to a plain dict.
+
+        Returns:
+            dict: Field values by name; nested records are expanded to dicts and
+                  packed arrays to lists
+        """
+        fields: tuple[str, ...] = self._fields
+        return {name: _plain(getattr(self, name)) for name in fields}
+
+    def __repr__(self) -> str:
+        names: tuple[str, ...] = self._fields
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in names)
+        return f'{type(self).__name__}({fields})'
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        names: tuple[str, ...] = self._fields
+        return all(getattr(self, name) == getattr(other, name) for name in names)
+
+
+class SkillResult(Record):
+    """
+    Result returned by every skill.
+
+    Attributes:
+        status (str): 'success', 'error', or 'warning'
+        message (str): Human-readable status message
+        data (Record | None): Skill-specific payload, or None on error
+        execution_time (float): Time taken to execute the operation
+    """
+    _fields: tuple[str, ...] = ('status', 'message', 'data', 'execution_time')
+    __slots__ = _fields
+
+    def __init__(self, status: str, message: str, data: Record | None, execution_time: float) -> None:
+        self.status = status
+        self.message = message
+        self.data = data
+        self.execution_time = execution_time
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Converts the result to the standardized response dict.
+
+        Returns:
+            dict: Response with 'status', 'message', 'data' (the payload expanded to
+                  a dict, empty for errors) and 'execution_time'
+        """
+        data = self.data
+        return {
+            'status': self.status,
+            'message': self.message,
+            'data': {} if data is None else data.to_dict(),
+            'execution_time': self.execution_time
+        }
+
+
+def vec3(values: Iterable[float]) -> FloatArray | None:
+    """
+    Packs a 3-component vector or RGB color into a float32 array.
+
+    Rendering works in single precision, so the packed form (12 bytes of payload)
+    loses nothing downstream and converts to other array types without a copy
+    through the buffer protocol.
+
+    Components are rounded to the nearest float32, and magnitudes beyond the
+    float32 range (about 3.4e38) are stored as +/-inf, so any range validation
+    must run on the caller's values before packing.
+
+    Args:
+        values (Iterable[float]): Vector components
+
+    Returns:
+        FloatArray | None: array('f') of length 3, or None if values does not have
+                         exactly 3 components
+    """
+    vector = array('f', values)
+    return vector if len(vector) == 3 else None
+
+
+def success(message: str, data: Record, start: float) -> SkillResult:
+    """
+    Builds a success result.
+
+    Args:
+        message (str): Human-readable status message
+        data (Record): Skill-specific payload
+        start (float): time.perf_counter() value taken when the skill started
+
+    Returns:
+        SkillResult: Success result
+    """
+    return SkillResult('success', message, data, _perf() - start)
+
+
+def error(message: str, start: float) -> SkillResult:
+    """
+    Builds an error result.
+
+    Args:
+        message (str): Human-readable error message
+        start (float): time.perf_counter() value taken when the skill started
+
+    Returns:
+        SkillResult: Error result without data
+    """
+    return SkillResult('error', message, None, _perf() - start)